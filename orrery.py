@@ -1,14 +1,21 @@
 import tkinter as tk
 from tkinter import ttk
-import json
 import os
-import time
+import fnmatch
 from datetime import datetime
 from dataclasses import dataclass
 from typing import Dict, Optional, List
 import math
+import bisect
 import threading
+import queue
 import logging
+import numpy as np
+import orjson
+from numba import njit, prange, float32, float64
+from numba.types import UniTuple
+from watchdog.events import FileSystemEventHandler
+from watchdog.observers import Observer
 
 # Set up logging
 logging.basicConfig(
@@ -16,7 +23,7 @@ logging.basicConfig(
     format='%(asctime)s - %(levelname)s - %(message)s'
 )
 
-@dataclass
+@dataclass(slots=True)
 class CelestialBody:
     body_id: int
     name: str
@@ -24,13 +31,20 @@ class CelestialBody:
     parent_id: Optional[int]
     semi_major_axis: float = 0
     eccentricity: float = 0
-    orbital_inclination: float = 0
+    orbital_inclination: float = 0  # Radians, converted from the journal's degrees on ingest
     orbital_period: float = 0
-    ascending_node: float = 0
-    mean_anomaly: float = 0
+    ascending_node: float = 0  # Radians
+    mean_anomaly: float = 0  # Radians
+    argument_of_periapsis: float = 0  # Radians
     radius: float = 0
     mass: float = 0
     distance_from_arrival: float = 0
+    # Orbit orientation terms, fixed per body so computed once on ingest
+    cos_inclination: float = 1
+    cos_ascending_node: float = 1
+    sin_ascending_node: float = 0
+    cos_periapsis: float = 1
+    sin_periapsis: float = 0
     # Additional properties for display
     planet_class: str = ""
     surface_temp: float = 0
@@ -39,6 +53,97 @@ class CelestialBody:
     terraform_state: str = ""
     is_landable: bool = False
 
+def get_parent_id(parents: List[dict]) -> Optional[int]:
+    """Get the BodyID of the nearest parent from a journal Parents list"""
+    if not parents:
+        return None
+    return next(iter(parents[0].values()), None)
+
+@njit(float64(float64, float64), cache=True, fastmath=True)
+def _solve_kepler(M, e):
+    """Solve Kepler's equation for the eccentric anomaly of a single body"""
+    if e < 0.3:
+        # Near-circular orbits: closed-form starting guess plus a single Newton step
+        E = math.atan2(math.sin(M), math.cos(M) - e)
+        E += 2 * math.pi * round((M - E) / (2 * math.pi))  # Same revolution as M
+        return E - (E - e * math.sin(E) - M) / (1 - e * math.cos(E))
+    
+    if e < 0.95:
+        # Moderate eccentricity: iterate Newton's method
+        E = M
+        for _ in range(5):
+            E -= (E - e * math.sin(E) - M) / (1 - e * math.cos(E))
+        return E
+    
+    # Highly eccentric orbits: Mikkola's cubic approximation, polished by one Newton step
+    turns = 2 * math.pi * round(M / (2 * math.pi))
+    M -= turns  # Mikkola's starter expects M in [-pi, pi]
+    alpha = (1 - e) / (4 * e + 0.5)
+    beta = M / (2 * (4 * e + 0.5))
+    sign = -1.0 if beta < 0 else 1.0  # Not a true sign(), which would give z == 0 at M == 0
+    z = np.cbrt(beta + sign * math.sqrt(beta ** 2 + alpha ** 3))
+    s = z - alpha / z
+    s -= 0.078 * s ** 5 / (1 + e)
+    E = M + e * (3 * s - 4 * s ** 3)
+    E -= (E - e * math.sin(E) - M) / (1 - e * math.cos(E))
+    return E + turns
+
+@njit(UniTuple(float32[:], 2)(float32[:], float32[:], float32[:], float32[:], float32[:],
+                             float32[:], float32[:], float32[:]),
+      cache=True, fastmath=True, parallel=True)
+def compute_positions(M, sma, ecc, cos_incl, cos_node, sin_node, cos_peri, sin_peri):
+    """Get every body's offset from its parent, projected onto the canvas plane"""
+    n = M.shape[0]
+    xs = np.empty(n, dtype=np.float32)
+    ys = np.empty(n, dtype=np.float32)
+    for i in prange(n):
+        E = _solve_kepler(M[i], ecc[i])
+        sinE = math.sin(E)
+        cosE = math.cos(E)
+        
+        # Position in the orbital plane, periapsis along the x axis
+        orb_x = sma[i] * (cosE - ecc[i])
+        orb_y = sma[i] * math.sqrt(1 - ecc[i] ** 2) * sinE
+        
+        # Rotate by argument of periapsis, inclination and ascending node, dropping z
+        px = cos_node[i] * cos_peri[i] - sin_node[i] * sin_peri[i] * cos_incl[i]
+        py = sin_node[i] * cos_peri[i] + cos_node[i] * sin_peri[i] * cos_incl[i]
+        qx = -cos_node[i] * sin_peri[i] - sin_node[i] * cos_peri[i] * cos_incl[i]
+        qy = -sin_node[i] * sin_peri[i] + cos_node[i] * cos_peri[i] * cos_incl[i]
+        xs[i] = px * orb_x + qx * orb_y
+        ys[i] = py * orb_x + qy * orb_y
+    return xs, ys
+
+ORBIT_POINTS = 64
+
+def orbit_outline(sma, ecc, cos_incl, cos_node, sin_node, cos_peri, sin_peri) -> np.ndarray:
+    """Sample a body's projected orbit as ORBIT_POINTS offsets from its parent"""
+    # Evenly spaced in eccentric anomaly, and run through the position kernel so
+    # the body always sits on its drawn orbit
+    E = np.linspace(0, 2 * np.pi, ORBIT_POINTS, endpoint=False)
+    M = (E - ecc * np.sin(E)).astype(np.float32)
+    elements = (np.full(ORBIT_POINTS, value, dtype=np.float32)
+                for value in (sma, ecc, cos_incl, cos_node, sin_node, cos_peri, sin_peri))
+    xs, ys = compute_positions(M, *elements)
+    return np.column_stack((xs, ys))
+
+def is_journal_file(path: str) -> bool:
+    return fnmatch.fnmatch(os.path.basename(path), 'Journal.*.log')
+
+class JournalEventHandler(FileSystemEventHandler):
+    """Pass journal file changes from the watchdog observer to the orrery"""
+    def __init__(self, orrery):
+        super().__init__()
+        self.orrery = orrery
+    
+    def on_created(self, event):
+        if not event.is_directory and is_journal_file(event.src_path):
+            self.orrery.switch_journal(event.src_path)
+    
+    def on_modified(self, event):
+        if not event.is_directory and is_journal_file(event.src_path):
+            self.orrery.read_journal(event.src_path)
+
 class SystemOrrery(tk.Tk):
     def __init__(self):
         super().__init__()
@@ -56,6 +161,31 @@ class SystemOrrery(tk.Tk):
         self.system_address = 0
         self.stars: List[int] = []
         
+        # Orbital elements as parallel column arrays, one row per body, grown as bodies arrive
+        self._orbit_lock = threading.Lock()
+        self._row_of: Dict[int, int] = {}
+        self._row_count = 0
+        self._body_ids: List[int] = []  # BodyID of each row
+        self._cols = self._alloc_columns(64)
+        self._xs = np.zeros(0, dtype=np.float32)
+        self._ys = np.zeros(0, dtype=np.float32)
+        
+        # Orbit tree, walked top-down each frame to place bodies relative to the root
+        self._children_of: Dict[int, List[int]] = {}
+        self._levels: List[np.ndarray] = []
+        self._pos = np.zeros((0, 2), dtype=np.float32)
+        
+        # Canvas items per body as (circle, label, orbit), created once and then moved
+        self._body_item: Dict[int, tuple] = {}
+        self._visible = np.zeros(0, dtype=bool)  # Rows whose circle and label are shown
+        self._orbit_visible = np.zeros(0, dtype=bool)
+        self._orbit_dirty = set()  # Rows whose orbit shape or parent changed since the last draw
+        self._last_px = np.zeros((0, 2), dtype=np.int32)  # Body pixel positions at the last draw
+        self._drawn_scale = 0.0
+        
+        # Warm up the compiled kernel (and Numba's thread pool) before the first frame
+        compute_positions(*(np.zeros(1, dtype=np.float32) for _ in range(8)))
+        
         # Create main frame
         self.main_frame = ttk.Frame(self)
         self.main_frame.grid(row=0, column=1, sticky="nsew")
@@ -65,6 +195,7 @@ class SystemOrrery(tk.Tk):
         # Create canvas
         self.canvas = tk.Canvas(self.main_frame, bg='black')
         self.canvas.grid(row=1, column=0, sticky="nsew", padx=10, pady=10)
+        self._cw, self._ch = 1200, 800  # Canvas size, kept current by <Configure>
         
         # Create info panel using Treeview
         self.info_frame = ttk.Frame(self)
@@ -82,6 +213,7 @@ class SystemOrrery(tk.Tk):
         self.tree.heading("#0", text="Name")
         self.tree.heading("type", text="Type")
         self.tree.heading("distance", text="Distance (ls)")
+        self._in_tree = set()  # BodyIDs already inserted into the tree
         
         # Canvas interaction variables
         self.center_x = 0
@@ -90,28 +222,40 @@ class SystemOrrery(tk.Tk):
         self.drag_start_y = 0
         self.is_dragging = False
         self.focused_body = None
+        self._pending_pan = [0, 0]
+        self._needs_redraw = False
+        self._idle_redraw_scheduled = False
+        self._pending_refresh = False
         
         # Bind canvas events
         self.canvas.bind('<ButtonPress-1>', self.start_drag)
         self.canvas.bind('<B1-Motion>', self.drag)
         self.canvas.bind('<ButtonRelease-1>', self.end_drag)
         self.canvas.bind('<MouseWheel>', self.zoom_canvas)
+        self.canvas.bind('<Configure>', self._on_canvas_resize)
         self.tree.bind('<<TreeviewSelect>>', self.on_body_select)
         
         # Scale and animation
         self.scale_factor = 1e-9
         self.zoom = 1.0
         self.animation_time = 0
+        self.time_step = 3600.0  # Simulated seconds per animation frame
+        self.frame_interval = 33  # Milliseconds between frames, about 30 fps
         self.animate = True
         
-        # Start monitoring thread
+        # Start watching the journal directory
         self.running = True
-        self.monitor_thread = threading.Thread(target=self.monitor_logs, daemon=True)
-        self.monitor_thread.start()
+        self._journal_queue = queue.Queue()
+        self.monitor_logs()
         
         # Start animation
         self.update_animation()
         
+    def _on_canvas_resize(self, event):
+        self._cw, self._ch = event.width, event.height
+        self._needs_redraw = True
+        self._schedule_idle_redraw()
+    
     def start_drag(self, event):
         self.drag_start_x = event.x
         self.drag_start_y = event.y
@@ -125,6 +269,37 @@ class SystemOrrery(tk.Tk):
             self.center_y += dy
             self.drag_start_x = event.x
             self.drag_start_y = event.y
+            self._pending_pan[0] += dx
+            self._pending_pan[1] += dy
+            self._schedule_idle_redraw()
+    
+    def zoom_canvas(self, event):
+        factor = 1.1 if event.delta > 0 else 1 / 1.1
+        self.zoom *= factor
+        self.center_x *= factor
+        self.center_y *= factor
+        self._needs_redraw = True
+        self._schedule_idle_redraw()
+    
+    def _schedule_idle_redraw(self):
+        # Input events can arrive faster than the canvas redraws, so fold them into one update
+        if not self._idle_redraw_scheduled:
+            self._idle_redraw_scheduled = True
+            self.after_idle(self._coalesced_redraw)
+    
+    def _coalesced_redraw(self):
+        self._idle_redraw_scheduled = False
+        
+        # Panning shifts every item by the same amount, so move them all in one call
+        dx, dy = self._pending_pan
+        self._pending_pan = [0, 0]
+        if dx or dy:
+            self.canvas.move('system', dx, dy)
+            self._last_px += (dx, dy)
+            self._needs_redraw = True  # Bodies may have panned into or out of view
+        
+        if self._needs_redraw:
+            self._needs_redraw = False
             self.draw_system()
     
     def end_drag(self, event):
@@ -141,50 +316,272 @@ class SystemOrrery(tk.Tk):
     
     def center_on_body(self, body):
         x, y = self.get_body_position(body)
-        canvas_center_x = self.canvas.winfo_width() / 2
-        canvas_center_y = self.canvas.winfo_height() / 2
+        canvas_center_x = self._cw / 2
+        canvas_center_y = self._ch / 2
         self.center_x = canvas_center_x - x
         self.center_y = canvas_center_y - y
         self.draw_system()
     
     def get_body_position(self, body: CelestialBody):
         """Get the current position of a body"""
-        if body.parent_id is None or body.parent_id == 0:
-            return (self.canvas.winfo_width() / 2 + self.center_x, 
-                   self.canvas.winfo_height() / 2 + self.center_y)
+        x = self._cw / 2 + self.center_x
+        y = self._ch / 2 + self.center_y
+        row = self._row_of.get(body.body_id)
+        if row is None or row >= len(self._pos):
+            return (x, y)
+        scale = self.scale_factor * self.zoom
+        return (x + self._pos[row, 0] * scale, y + self._pos[row, 1] * scale)
+    
+    def _alloc_columns(self, capacity):
+        # Single precision is plenty for positions that end up as canvas pixels
+        cols = {name: np.zeros(capacity, dtype=np.float32) for name in
+                ('sma', 'ecc', 'period', 'M0', 'cos_i', 'cos_node', 'sin_node', 'cos_peri',
+                 'sin_peri', 'marker_radius')}
+        cols['orbit_shape'] = np.zeros((capacity, ORBIT_POINTS, 2), dtype=np.float32)
+        cols['orbit_min'] = np.zeros((capacity, 2), dtype=np.float32)  # Bounding box of the shape
+        cols['orbit_max'] = np.zeros((capacity, 2), dtype=np.float32)
+        cols['parent_id'] = np.full(capacity, -1, dtype=np.int64)
+        cols['parent_idx'] = np.full(capacity, -1, dtype=np.intp)
+        return cols
+    
+    def store_body_row(self, body: CelestialBody):
+        """Write a body's orbital elements into its row of the column arrays"""
+        with self._orbit_lock:
+            row = self._row_of.get(body.body_id)
+            if row is None:
+                row = self._row_count
+                capacity = len(self._cols['sma'])
+                if row == capacity:
+                    cols = self._alloc_columns(capacity * 2)
+                    for name, col in self._cols.items():
+                        cols[name][:capacity] = col
+                    self._cols = cols
+                self._row_of[body.body_id] = row
+                self._body_ids.append(body.body_id)
+                self._row_count += 1
             
-        parent = self.bodies.get(body.parent_id)
-        if parent is None:
-            return (self.canvas.winfo_width() / 2 + self.center_x, 
-                   self.canvas.winfo_height() / 2 + self.center_y)
+            cols = self._cols
+            cols['sma'][row] = body.semi_major_axis
+            cols['ecc'][row] = body.eccentricity
+            cols['period'][row] = body.orbital_period
+            cols['M0'][row] = body.mean_anomaly
+            cols['cos_i'][row] = body.cos_inclination
+            cols['cos_node'][row] = body.cos_ascending_node
+            cols['sin_node'][row] = body.sin_ascending_node
+            cols['cos_peri'][row] = body.cos_periapsis
+            cols['sin_peri'][row] = body.sin_periapsis
             
-        parent_x, parent_y = self.get_body_position(parent)
-        offset_x, offset_y = self.calculate_position(body, self.animation_time)
-        return (parent_x + offset_x, parent_y + offset_y)
+            # The orbit's shape never changes, so sample it once and only translate it later
+            shape = orbit_outline(body.semi_major_axis, body.eccentricity, body.cos_inclination,
+                                  body.cos_ascending_node, body.sin_ascending_node,
+                                  body.cos_periapsis, body.sin_periapsis)
+            cols['orbit_shape'][row] = shape
+            cols['orbit_min'][row] = shape.min(axis=0)
+            cols['orbit_max'][row] = shape.max(axis=0)
+            self._orbit_dirty.add(row)
+            
+            cols['marker_radius'][row] = 8 if body.type == 'Star' else 4
+            cols['parent_id'][row] = -1 if body.parent_id is None else body.parent_id
+            cols['parent_idx'][row] = self._row_of.get(body.parent_id, -1)
+            
+            # Bodies scanned before their parent get linked to it now
+            n = self._row_count
+            orphans = cols['parent_id'][:n] == body.body_id
+            cols['parent_idx'][:n][orphans] = row
+            self._orbit_dirty.update(np.flatnonzero(orphans).tolist())
+            self._rebuild_levels()
     
-    def update_body_list(self):
-        self.tree.delete(*self.tree.get_children())
-        
-        # Sort bodies by semi-major axis for each parent
-        parent_groups = {}
-        for body in self.bodies.values():
-            parent_id = body.parent_id if body.parent_id is not None else -1
-            if parent_id not in parent_groups:
-                parent_groups[parent_id] = []
-            parent_groups[parent_id].append(body)
-        
-        # Add primary stars first
-        for body in sorted(parent_groups.get(-1, []), key=lambda x: x.body_id):
-            self.add_body_to_tree("", body)
+    def _rebuild_levels(self):
+        # Bodies whose parent hasn't been scanned are drawn as roots at the centre
+        self._children_of = {}
+        roots = []
+        for row, parent_row in enumerate(self._cols['parent_idx'][:self._row_count].tolist()):
+            if parent_row < 0:
+                roots.append(row)
+            else:
+                self._children_of.setdefault(parent_row, []).append(row)
+        
+        # Group rows by depth so each level can be placed in one vectorized step
+        self._levels = []
+        level = roots
+        while level:
+            self._levels.append(np.array(level, dtype=np.intp))
+            level = [child for row in level for child in self._children_of.get(row, [])]
+    
+    def update_orbit_positions(self):
+        """Compute every body's position relative to the root at the current animation time"""
+        with self._orbit_lock:
+            n = self._row_count
+            cols = self._cols
+            period = cols['period'][:n]
+            # Mean anomaly is reduced in double precision, as animation_time grows without bound
+            mean_motion = np.divide(2 * np.pi, period, out=np.zeros(n), where=period > 0)
+            M = np.mod(cols['M0'][:n] + mean_motion * self.animation_time, 2 * np.pi)
+            M = M.astype(np.float32)
+            self._xs, self._ys = compute_positions(M, cols['sma'][:n], cols['ecc'][:n],
+                                                   cols['cos_i'][:n], cols['cos_node'][:n],
+                                                   cols['sin_node'][:n], cols['cos_peri'][:n],
+                                                   cols['sin_peri'][:n])
             
-        # Add planets and moons in order of semi-major axis
-        for parent_id, children in parent_groups.items():
-            if parent_id != -1:  # Skip primary stars
-                for body in sorted(children, key=lambda x: x.semi_major_axis):
-                    parent = "" if body.parent_id is None else str(body.parent_id)
-                    self.add_body_to_tree(parent, body)
-    
-    def add_body_to_tree(self, parent, body):
+            # Walk the orbit tree top-down, adding each body's offset to its parent's position
+            pos = np.zeros((n, 2), dtype=np.float32)
+            offsets = np.column_stack((self._xs, self._ys))
+            parent_idx = cols['parent_idx'][:n]
+            for level in self._levels[1:]:
+                pos[level] = pos[parent_idx[level]] + offsets[level]
+            self._pos = pos
+    
+    def create_body_items(self, body: CelestialBody):
+        """Create the canvas items for a newly scanned body"""
+        color = 'yellow' if body.type == 'Star' else 'deep sky blue'
+        orbit_id = self.canvas.create_polygon(0, 0, 0, 0, 0, 0, fill='', outline='gray25',
+                                              state='hidden', tags=('system', 'orbit'))
+        circle_id = self.canvas.create_oval(0, 0, 0, 0, fill=color, outline='', state='hidden',
+                                            tags=('system', 'body'))
+        label_id = self.canvas.create_text(0, 0, text=body.name, fill='white', state='hidden',
+                                           font=('Arial', 8), tags=('system', 'label'))
+        self.canvas.tag_lower('orbit')
+        return (circle_id, label_id, orbit_id)
+    
+    def screen_positions(self):
+        """Get the canvas pixel position of every body placed by the last physics tick"""
+        scale = self.scale_factor * self.zoom
+        screen = self._pos * scale + (self._cw / 2 + self.center_x,
+                                      self._ch / 2 + self.center_y)
+        return np.rint(screen).astype(np.int32)
+    
+    def draw_system(self, only_if_moved=False):
+        new_px = self.screen_positions()
+        n = len(new_px)
+        
+        # Only touch items whose pixel position changed; a zoom changes them all
+        scale = self.scale_factor * self.zoom
+        changed = np.ones(n, dtype=bool)
+        if scale == self._drawn_scale:
+            m = min(n, len(self._last_px))
+            changed[:m] = np.any(new_px[:m] != self._last_px[:m], axis=1)
+        if only_if_moved and not changed.any():
+            return
+        old_px = self._last_px
+        rescaled = scale != self._drawn_scale
+        self._last_px = new_px
+        self._drawn_scale = scale
+        
+        # Items are created once per body, then only moved
+        body_ids = self._body_ids[:n]
+        for body_id in body_ids:
+            if body_id not in self._body_item:
+                self._body_item[body_id] = self.create_body_items(self.bodies[body_id])
+        
+        cols = self._cols
+        marker_radius = cols['marker_radius'][:n].astype(np.int32).tolist()
+        parent_idx = cols['parent_idx'][:n]
+        has_orbit = (parent_idx >= 0) & (parent_idx < n) & (cols['sma'][:n] > 0)
+        parent_rows = np.where(has_orbit, parent_idx, 0)
+        parent_px = new_px[parent_rows]
+        orbit_lo = parent_px + cols['orbit_min'][:n] * scale
+        orbit_hi = parent_px + cols['orbit_max'][:n] * scale
+        orbit_dirty = np.zeros(n, dtype=bool)
+        dirty_rows = [row for row in self._orbit_dirty if row < n]
+        orbit_dirty[dirty_rows] = True
+        self._orbit_dirty.difference_update(dirty_rows)
+        
+        # Cull anything off the canvas; the margin keeps labels near the edge visible
+        width = self._cw
+        height = self._ch
+        margin = 50
+        x, y = new_px[:, 0], new_px[:, 1]
+        visible = (x >= -margin) & (x < width + margin) & (y >= -margin) & (y < height + margin)
+        orbit_visible = (has_orbit & (orbit_hi[:, 0] >= 0) & (orbit_lo[:, 0] < width)
+                         & (orbit_hi[:, 1] >= 0) & (orbit_lo[:, 1] < height))
+        was_visible = np.zeros(n, dtype=bool)
+        was_visible[:len(self._visible)] = self._visible[:n]
+        orbit_was_visible = np.zeros(n, dtype=bool)
+        orbit_was_visible[:len(self._orbit_visible)] = self._orbit_visible[:n]
+        self._visible = visible
+        self._orbit_visible = orbit_visible
+        
+        px = new_px.tolist()
+        items = [self._body_item[body_id] for body_id in body_ids]
+        
+        for row in np.flatnonzero(visible != was_visible).tolist():
+            state = 'normal' if visible[row] else 'hidden'
+            circle_id, label_id, _ = items[row]
+            self.canvas.itemconfigure(circle_id, state=state)
+            self.canvas.itemconfigure(label_id, state=state)
+        for row in np.flatnonzero(orbit_visible != orbit_was_visible).tolist():
+            self.canvas.itemconfigure(items[row][2],
+                                      state='normal' if orbit_visible[row] else 'hidden')
+        
+        # Hidden items are left where they were, so bring them up to date as they reappear
+        for row in np.flatnonzero(visible & (changed | ~was_visible)).tolist():
+            circle_id, label_id, _ = items[row]
+            x, y = px[row]
+            r = marker_radius[row]
+            self.canvas.coords(circle_id, x - r, y - r, x + r, y + r)
+            self.canvas.coords(label_id, x, y + r + 8)
+        
+        # An orbit is rebuilt when it reappears, is rescaled or changed shape; otherwise
+        # it just follows its parent
+        reshape = orbit_visible & (~orbit_was_visible | orbit_dirty | rescaled
+                                   | (parent_rows >= len(old_px)))
+        for row in np.flatnonzero(reshape).tolist():
+            points = np.rint(parent_px[row] + cols['orbit_shape'][row] * scale).astype(np.int32)
+            self.canvas.coords(items[row][2], *points.ravel().tolist())
+        
+        follow = np.flatnonzero(orbit_visible & ~reshape & changed[parent_rows])
+        deltas = (parent_px[follow] - old_px[parent_rows[follow]]).tolist()
+        for row, (dx, dy) in zip(follow.tolist(), deltas):
+            self.canvas.move(items[row][2], dx, dy)
+    
+    def update_animation(self):
+        """Start the physics and redraw loops"""
+        self._tick_physics()
+        self._redraw()
+    
+    def _tick_physics(self):
+        self._drain_journal_queue()
+        if self.animate:
+            self.animation_time += self.time_step
+            self.update_orbit_positions()
+        if self.running:
+            self.after(self.frame_interval, self._tick_physics)
+    
+    def _redraw(self):
+        # Canvas updates are the expensive part, so skip frames where nothing visibly moved
+        if self.canvas.winfo_viewable():
+            self.draw_system(only_if_moved=True)
+        if self.running:
+            self.after(self.frame_interval, self._redraw)
+    
+    def update_body_list(self):
+        # Only bodies scanned since the last update need adding; the rest stay put
+        for body in list(self.bodies.values()):
+            if body.body_id not in self._in_tree:
+                self._insert_body_into_tree(body)
+    
+    def _insert_body_into_tree(self, body: CelestialBody):
+        parent = str(body.parent_id) if body.parent_id in self._in_tree else ""
+        self.add_body_to_tree(parent, body, self._tree_index(parent, body))
+        self._in_tree.add(body.body_id)
+        
+        # Adopt any bodies that were scanned before this one, their parent
+        for child_iid in self.tree.get_children(""):
+            child = self.bodies.get(int(child_iid))
+            if child is not None and child.parent_id == body.body_id:
+                self.tree.move(child_iid, str(body.body_id),
+                               self._tree_index(str(body.body_id), child))
+    
+    def _tree_index(self, parent, body):
+        """Get the insert position that keeps a tree level sorted"""
+        # Top level is ordered by body ID, planets and moons by semi-major axis
+        def sort_key(b):
+            return b.body_id if parent == "" else b.semi_major_axis
+        siblings = [self.bodies[int(iid)] for iid in self.tree.get_children(parent)
+                    if int(iid) != body.body_id]
+        return bisect.bisect_right([sort_key(b) for b in siblings], sort_key(body))
+    
+    def add_body_to_tree(self, parent, body, index='end'):
         body_info = (
             f"Class: {body.planet_class}\n"
             f"Temperature: {body.surface_temp:.1f}K\n"
@@ -194,16 +591,25 @@ class SystemOrrery(tk.Tk):
             f"Landable: {'Yes' if body.is_landable else 'No'}"
         )
         
-        self.tree.insert(parent, 'end', iid=str(body.body_id), text=body.name,
+        self.tree.insert(parent, index, iid=str(body.body_id), text=body.name,
                         values=(body.type, f"{body.distance_from_arrival:.1f}"),
                         tags=(body.body_id,))
     
-    def process_log_entry(self, data: dict):
-        if data['event'] == 'Scan':
+    def process_log_entries(self, entries: List[dict]):
+        """Ingest a batch of journal events, refreshing the display once for all of them"""
+        new_bodies = [body for body in map(self.process_log_entry, entries) if body is not None]
+        if new_bodies:
+            self._schedule_refresh()
+    
+    def process_log_entry(self, data: dict) -> Optional[CelestialBody]:
+        if data.get('event') == 'Scan':
             body_id = data.get('BodyID', 0)
             
             try:
                 is_star = 'StarType' in data
+                inclination = float(data.get('OrbitalInclination', 0)) * math.pi / 180.0
+                ascending_node = float(data.get('AscendingNode', 0)) * math.pi / 180.0
+                periapsis = float(data.get('Periapsis', 0)) * math.pi / 180.0
                 body = CelestialBody(
                     body_id=body_id,
                     name=data['BodyName'],
@@ -211,13 +617,19 @@ class SystemOrrery(tk.Tk):
                     parent_id=get_parent_id(data.get('Parents', [])),
                     semi_major_axis=float(data.get('SemiMajorAxis', 0)),
                     eccentricity=float(data.get('Eccentricity', 0)),
-                    orbital_inclination=float(data.get('OrbitalInclination', 0)) * math.pi / 180.0,
+                    orbital_inclination=inclination,
                     orbital_period=float(data.get('OrbitalPeriod', 0)),
-                    ascending_node=float(data.get('AscendingNode', 0)) * math.pi / 180.0,
+                    ascending_node=ascending_node,
                     mean_anomaly=float(data.get('MeanAnomaly', 0)) * math.pi / 180.0,
+                    argument_of_periapsis=periapsis,
                     radius=float(data.get('Radius', 0)),
                     mass=float(data.get('StellarMass' if is_star else 'MassEM', 0)),
                     distance_from_arrival=float(data.get('DistanceFromArrivalLS', 0)),
+                    cos_inclination=math.cos(inclination),
+                    cos_ascending_node=math.cos(ascending_node),
+                    sin_ascending_node=math.sin(ascending_node),
+                    cos_periapsis=math.cos(periapsis),
+                    sin_periapsis=math.sin(periapsis),
                     # Additional properties
                     planet_class=data.get('PlanetClass', ''),
                     surface_temp=float(data.get('SurfaceTemperature', 0)),
@@ -230,41 +642,106 @@ class SystemOrrery(tk.Tk):
                 self.bodies[body_id] = body
                 if is_star:
                     self.stars.append(body_id)
+                self.store_body_row(body)
+                return body
                     
             except Exception as e:
                 logging.error(f"Error processing body data: {e}")
-                
-        self.after(0, self.draw_system)
-        self.after(0, self.update_body_list)
+        return None
+    
+    def _schedule_refresh(self):
+        # Scans arrive in bursts during discovery, so refresh once for the whole burst
+        if not self._pending_refresh:
+            self._pending_refresh = True
+            self.after(50, self._do_pending_refresh)
+    
+    def _do_pending_refresh(self):
+        self._pending_refresh = False
+        self.update_orbit_positions()
+        self.draw_system()
+        self.update_body_list()
     def monitor_logs(self):
         directory = os.path.expandvars(r'C:\Users\%USERNAME%\Saved Games\Frontier Developments\Elite Dangerous')
         logging.info(f"Monitoring directory: {directory}")
         
-        while self.running:
-            newest_file = self.get_newest_file(directory)
-            if newest_file:
-                logging.info(f"Reading from file: {newest_file}")
+        # Start from the end of the current journal, like a tail. Journals created
+        # later are picked up by the observer, so the directory is only listed once.
+        self.journal_path = None
+        self._journal_fd = None
+        self._tail_buf = b''
+        newest_file = self.get_newest_file(directory)
+        if newest_file:
+            self.switch_journal(newest_file, from_end=True)
+        
+        self.observer = Observer()
+        try:
+            self.observer.schedule(JournalEventHandler(self), directory)
+            self.observer.start()
+        except OSError as e:
+            logging.error(f"Failed to watch directory: {e}")
+    
+    def read_journal(self, path):
+        """Read the lines appended to a journal since it was last read"""
+        if path != self.journal_path or self._journal_fd is None:
+            return
+        
+        entries = []
+        while True:
+            try:
+                chunk = os.read(self._journal_fd, 65536)
+            except OSError as e:
+                logging.error(f"Failed to read {path}: {e}")
+                break
+            if not chunk:
+                break
+            
+            # Keep a partly written last line for the next read
+            *lines, self._tail_buf = (self._tail_buf + chunk).split(b'\n')
+            for line in lines:
+                if not line.strip():
+                    continue
                 try:
-                    with open(newest_file, 'r', encoding='utf-8') as file:
-                        file.seek(0, os.SEEK_END)
-                        while self.running:
-                            line = file.readline()
-                            if line:
-                                try:
-                                    data = json.loads(line.strip())
-                                    self.process_log_entry(data)
-                                except json.JSONDecodeError as e:
-                                    logging.error(f"Failed to parse log line: {e}")
-                                    logging.error(f"Problematic line: {line}")
-                            time.sleep(0.1)
-                except FileNotFoundError:
-                    logging.error(f"File not found: {newest_file}")
-            time.sleep(1)
+                    data = orjson.loads(line)
+                except orjson.JSONDecodeError as e:
+                    logging.error(f"Failed to parse log line: {e}")
+                    logging.error(f"Problematic line: {line.decode('utf-8', 'replace')}")
+                    continue
+                if isinstance(data, dict):
+                    entries.append(data)
+                else:
+                    logging.error(f"Ignoring log line that is not an event: {line.decode('utf-8', 'replace')}")
+        
+        if entries:
+            self._journal_queue.put(entries)
+    
+    def _drain_journal_queue(self):
+        # Events are parsed on the observer thread but ingested on the Tk thread
+        while True:
+            try:
+                entries = self._journal_queue.get_nowait()
+            except queue.Empty:
+                return
+            self.process_log_entries(entries)
+    
+    def switch_journal(self, path, from_end=False):
+        """Start reading a journal, from its beginning unless from_end is set"""
+        logging.info(f"Reading from file: {path}")
+        if self._journal_fd is not None:
+            os.close(self._journal_fd)
+            self._journal_fd = None
+        self.journal_path = path
+        self._tail_buf = b''
+        try:
+            self._journal_fd = os.open(path, os.O_RDONLY | getattr(os, 'O_BINARY', 0))
+            if from_end:
+                os.lseek(self._journal_fd, 0, os.SEEK_END)
+        except FileNotFoundError:
+            logging.error(f"File not found: {path}")
     
     def get_newest_file(self, directory):
         try:
             files = [os.path.join(directory, f) for f in os.listdir(directory) 
-                    if f.startswith('Journal.') and f.endswith('.log')]
+                    if is_journal_file(f)]
             files = [f for f in files if os.path.isfile(f)]
             if not files:
                 return None
@@ -276,6 +753,11 @@ class SystemOrrery(tk.Tk):
     def on_closing(self):
         logging.info("Shutting down System Orrery")
         self.running = False
+        self.observer.stop()
+        if self.observer.is_alive():
+            self.observer.join()  # Let an in-flight read_journal finish before closing its fd
+        if self._journal_fd is not None:
+            os.close(self._journal_fd)
         self.destroy()
 
 if __name__ == "__main__":